@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Compara os três simuladores de AFD sobre o mesmo autômato e as mesmas cadeias:
+- dicionário: verificar_cadeia_afd (rev_comp)
+- tabela:     verificar_cadeia_tabela (afd_compilado)
+- encadeado:  dicionários encadeados de encadear_afd (afd_compilado)
+
+Sem argumentos, roda uma bateria com o AFD de exemplo, AFDs gerados por regex_para_afd
+com centenas a milhares de estados e AFDs aleatórios grandes.
+
+ex: python benchmarks/bench_afd.py
+ex: python benchmarks/bench_afd.py arquivos/saida/afd_saida.txt 2000 200
+"""
+import os
+import random
+import sys
+import timeit
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from conversores.rev_comp import ler_afd, verificar_cadeia_afd
+from conversores.afd_compilado import tabelar_afd, verificar_cadeia_tabela, encadear_afd
+from conversores.regex_afn import regex_para_afd
+
+def gerar_cadeias(transicoes, inicial, quantidade, tamanho, semente=0):
+    """
+    Gera cadeias percorrendo o AFD a partir do inicial, para que não sejam rejeitadas logo no primeiro símbolo
+    """
+    rnd = random.Random(semente)
+    cadeias = []
+    for _ in range(quantidade):
+        atual = inicial
+        simbolos = []
+        for _ in range(tamanho):
+            opcoes = sorted(a for a, d in transicoes.get(atual, {}).items() if d and next(iter(d)))
+            if not opcoes:
+                break
+            a = rnd.choice(opcoes)
+            simbolos.append(a)
+            atual = next(iter(transicoes[atual][a]))
+        cadeias.append(''.join(simbolos))
+    return cadeias
+
+def medir(nome, funcao, cadeias, repeticoes):
+    tempo = min(timeit.repeat(lambda: [funcao(w) for w in cadeias], number=1, repeat=repeticoes))
+    simbolos = sum(len(w) for w in cadeias)
+    print(f"{nome:<12} {tempo * 1e3:10.2f} ms   {simbolos / tempo / 1e6:8.2f} Msímb/s")
+    return tempo
+
+def afd_aleatorio(n_estados, alfabeto='ab', semente=0):
+    """
+    AFD completo com n_estados, transições sorteadas e metade dos estados finais
+    """
+    rnd = random.Random(semente)
+    nomes = [frozenset({f'q{i}'}) for i in range(n_estados)]
+    transicoes = defaultdict(lambda: defaultdict(set))
+    for q in nomes:
+        for a in alfabeto:
+            transicoes[q][a].add(rnd.choice(nomes))
+    finais = {q for q in nomes if rnd.random() < 0.5}
+    return set(nomes), frozenset(alfabeto), transicoes, nomes[0], finais
+
+def comparar(descricao, afd, quantidade, tamanho):
+    estados, alfabeto, transicoes, inicial, finais = afd
+    cadeias = gerar_cadeias(transicoes, inicial, quantidade, tamanho)
+    tabela, colunas, finais_idx = tabelar_afd(estados, alfabeto, transicoes, inicial, finais)
+    aceita = encadear_afd(estados, alfabeto, transicoes, inicial, finais)
+
+    # as cadeias só usam transições definidas, então verificar_cadeia_afd não imprime nada
+    def por_dicionario(w):
+        return verificar_cadeia_afd(transicoes, inicial, finais, w)
+
+    esperado = [por_dicionario(w) for w in cadeias]
+    assert esperado == [verificar_cadeia_tabela(tabela, colunas, finais_idx, w) for w in cadeias]
+    assert esperado == [aceita(w) for w in cadeias]
+
+    print(f"\nAFD: {descricao} | {len(tabela)} estados | {quantidade} cadeias de até {tamanho} símbolos")
+    base = medir('dicionário', por_dicionario, cadeias, 5)
+    t_tabela = medir('tabela', lambda w: verificar_cadeia_tabela(tabela, colunas, finais_idx, w), cadeias, 5)
+    t_enc = medir('encadeado', aceita, cadeias, 5)
+    print(f"ganho tabela: {base / t_tabela:.1f}x | ganho encadeado: {base / t_enc:.1f}x")
+
+def main():
+    args = sys.argv[1:]
+    quantidade = int(args[1]) if len(args) > 1 else 300
+    tamanho = int(args[2]) if len(args) > 2 else 200
+
+    if args:
+        comparar(args[0], ler_afd(args[0]), quantidade, tamanho)
+        return
+
+    comparar('arquivos/saida/afd_saida.txt', ler_afd('arquivos/saida/afd_saida.txt'), quantidade, tamanho)
+    # (a|b)*a(a|b)^k precisa de 2^(k+1) estados no AFD
+    for k in (5, 7, 9):
+        padrao = '(a|b)*a' + '(a|b)' * k
+        comparar(f"regex (a|b)*a(a|b)^{k}", regex_para_afd(padrao), quantidade, tamanho)
+    for n in (2000, 20000):
+        comparar(f"aleatório com {n} estados", afd_aleatorio(n), quantidade, tamanho)
+
+if __name__ == "__main__":
+    main()
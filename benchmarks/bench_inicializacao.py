@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Mede o custo de inicialização do main.py em execuções curtas:
+- import do main.py e de cada conversor em um processo novo
+- execução completa de `main.py afd` lendo o texto vs. carregando o snapshot (--snapshot)
+- ler_afd vs. ler_afd_snapshot no mesmo processo
+
+ex: python benchmarks/bench_inicializacao.py arquivos/saida/afd_saida.txt 20
+"""
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, RAIZ)
+
+from conversores.rev_comp import ler_afd, ler_afd_snapshot, EXTENSAO_SNAPSHOT
+
+def tempo_processo(comando, repeticoes):
+    """
+    Mediana do tempo de parede (ms) de `repeticoes` processos novos executando o comando
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = timeit.default_timer()
+        subprocess.run(comando, cwd=RAIZ, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        tempos.append(timeit.default_timer() - inicio)
+    return statistics.median(tempos) * 1e3
+
+def main():
+    args = sys.argv[1:]
+    caminho = args[0] if args else 'arquivos/saida/afd_saida.txt'
+    repeticoes = int(args[1]) if len(args) > 1 else 20
+    py = sys.executable
+
+    print(f"Processos novos (mediana de {repeticoes}):")
+    base = tempo_processo([py, '-c', 'pass'], repeticoes)
+    print(f"  {'python vazio':<28} {base:8.2f} ms")
+    imports = [
+        ('import main', 'import main'),
+        ('import glud_afn', 'import conversores.glud_afn'),
+        ('import afn_afd', 'import conversores.afn_afd'),
+        ('import rev_comp', 'import conversores.rev_comp'),
+    ]
+    for nome, codigo in imports:
+        t = tempo_processo([py, '-c', codigo], repeticoes)
+        print(f"  {nome:<28} {t:8.2f} ms  (+{t - base:.2f})")
+
+    # saídas descartáveis em arquivos/saida/, removidas no fim
+    saida_comp, saida_rev = 'bench_inicializacao_comp.txt', 'bench_inicializacao_rev.txt'
+    comando = [py, 'main.py', 'afd', caminho, saida_comp, saida_rev, 'ab']
+    snapshot = os.path.join(RAIZ, caminho + EXTENSAO_SNAPSHOT)
+    if os.path.exists(snapshot):
+        os.remove(snapshot)
+    t_texto = tempo_processo(comando, repeticoes)
+    t_snap = tempo_processo(comando + ['--snapshot'], repeticoes)
+    print(f"  {'main.py afd (texto)':<28} {t_texto:8.2f} ms")
+    print(f"  {'main.py afd --snapshot':<28} {t_snap:8.2f} ms")
+    for arq in (saida_comp, saida_rev):
+        os.remove(os.path.join(RAIZ, 'arquivos', 'saida', arq))
+
+    print("\nNo mesmo processo (melhor de 5 x 200 leituras):")
+    alvo = os.path.join(RAIZ, caminho)
+    ler_afd_snapshot(alvo)
+    t_ler = min(timeit.repeat(lambda: ler_afd(alvo), number=200, repeat=5)) / 200
+    t_ler_snap = min(timeit.repeat(lambda: ler_afd_snapshot(alvo), number=200, repeat=5)) / 200
+    print(f"  {'ler_afd':<28} {t_ler * 1e6:8.1f} µs")
+    print(f"  {'ler_afd_snapshot':<28} {t_ler_snap * 1e6:8.1f} µs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import os
+import threading
+from collections import OrderedDict
+
+from conversores.rev_comp import ler_afd, formatar_estado
+
+# ★★★★★★★★★★★★★★★★#
+#    AFD EM TABELA        #
+# ★★★★★★★★★★★★★★★★#
+
+def numerar_estados_afd(estados, transicoes, inicial):
+    """
+    Atribui um índice inteiro a cada estado do AFD.
+    O estado inicial sempre recebe o índice 0; os demais seguem a ordem de formatar_estado
+    """
+    todos = set(estados) | set(transicoes.keys())
+    for mapa in transicoes.values():
+        for dests in mapa.values():
+            todos |= set(dests)
+    todos.discard(inicial)
+
+    ordem = [inicial] + sorted(todos, key=formatar_estado)
+    return {q: i for i, q in enumerate(ordem)}, ordem
+
+def tabelar_afd(estados, alfabeto, transicoes, inicial, finais):
+    """
+    Converte o AFD (dicionário de frozensets) em uma tabela de transições indexada por inteiros:
+    tabela[estado][coluna] = próximo estado ou -1 quando a transição não está definida.
+    Retorna (tabela, colunas, finais_idx), onde colunas mapeia símbolo -> coluna
+    """
+    indices, ordem = numerar_estados_afd(estados, transicoes, inicial)
+    colunas = {a: j for j, a in enumerate(sorted(alfabeto))}
+
+    tabela = []
+    for q in ordem:
+        linha = [-1] * len(colunas)
+        for a, dests in transicoes.get(q, {}).items():
+            if a in colunas and dests:
+                linha[colunas[a]] = indices[next(iter(dests))]
+        tabela.append(linha)
+
+    finais_idx = frozenset(indices[q] for q in finais if q in indices)
+    return tabela, colunas, finais_idx
+
+def verificar_cadeia_tabela(tabela, colunas, finais_idx, cadeia):
+    """
+    Simula a cadeia sobre a tabela gerada por tabelar_afd (estado inicial = 0).
+    Mesma semântica de verificar_cadeia_afd: símbolo desconhecido ou transição indefinida rejeita
+    """
+    atual = 0
+    for c in cadeia:
+        j = colunas.get(c)
+        if j is None:
+            return False
+        atual = tabela[atual][j]
+        if atual < 0:
+            return False
+    return atual in finais_idx
+
+def estados_mortos(tabela, finais_idx):
+    """
+    Índices dos estados mortos da tabela: não finais e cujas transições definidas só voltam
+    para eles mesmos (ex: o `{}` gerado por converter_afn_afd). Chegar em um deles já rejeita
+    """
+    return {i for i, linha in enumerate(tabela)
+            if i not in finais_idx and all(d in (-1, i) for d in linha)}
+
+# ★★★★★★★★★★★★★★★★#
+#    AFD ENCADEADO        #
+# ★★★★★★★★★★★★★★★★#
+
+# Quantos verificadores (e arquivos) ficam em cache; os menos usados são descartados
+MAX_CACHE_ENCADEADOS = 64
+
+# cache LRU de verificadores já montados, indexado pela assinatura do AFD
+_cache_encadeados = OrderedDict()
+# cache LRU por arquivo: caminho -> (mtime, tamanho, verificador)
+_cache_arquivos = OrderedDict()
+# os caches são usados de várias threads (ex: servico.py carrega via asyncio.to_thread);
+# a trava cobre só as operações nos OrderedDicts, a montagem dos dicionários roda fora dela
+_trava_cache = threading.Lock()
+
+# Chave extra dos estados finais nos dicionários encadeados: a iteração de uma str
+# nunca produz '', então ela não colide com nenhum símbolo
+MARCA_FINAL = ''
+
+def encadear_tabela(tabela, colunas, finais_idx):
+    """
+    Transforma a tabela em dicionários encadeados: cada estado vivo vira um dict
+    símbolo -> dict do próximo estado, e os finais recebem a chave MARCA_FINAL.
+    Transições indefinidas ou para estados mortos simplesmente não existem no dict,
+    então cada símbolo custa uma única busca, independente do número de estados.
+    Retorna o dict do estado inicial
+    """
+    mortos = estados_mortos(tabela, finais_idx)
+    nos = [{} for _ in tabela]
+    for i, linha in enumerate(tabela):
+        if i in mortos:
+            continue
+        no = nos[i]
+        for a, j in colunas.items():
+            dest = linha[j]
+            if dest >= 0 and dest not in mortos:
+                no[a] = nos[dest]
+        if i in finais_idx:
+            no[MARCA_FINAL] = True
+    return nos[0]
+
+def _assinatura_afd(alfabeto, transicoes, inicial, finais):
+    trans = tuple(sorted(
+        (formatar_estado(o), a, formatar_estado(d))
+        for o, mapa in transicoes.items()
+        for a, dests in mapa.items()
+        for d in dests
+    ))
+    return (
+        tuple(sorted(alfabeto)),
+        trans,
+        formatar_estado(inicial),
+        tuple(sorted(formatar_estado(q) for q in finais)),
+    )
+
+def _buscar_lru(cache, chave):
+    with _trava_cache:
+        valor = cache.get(chave)
+        if valor is not None:
+            cache.move_to_end(chave)
+        return valor
+
+def _guardar_lru(cache, chave, valor):
+    with _trava_cache:
+        cache[chave] = valor
+        cache.move_to_end(chave)
+        while len(cache) > MAX_CACHE_ENCADEADOS:
+            cache.popitem(last=False)
+
+def encadear_afd(estados, alfabeto, transicoes, inicial, finais):
+    """
+    Monta os dicionários encadeados do AFD e devolve o verificador `aceita(cadeia) -> bool`,
+    com a mesma semântica de verificar_cadeia_afd. Cada caractere faz só `no = no[c]`.
+    AFDs idênticos reaproveitam o mesmo verificador (cache LRU)
+    """
+    chave = _assinatura_afd(alfabeto, transicoes, inicial, finais)
+    aceita = _buscar_lru(_cache_encadeados, chave)
+    if aceita is not None:
+        return aceita
+
+    tabela, colunas, finais_idx = tabelar_afd(estados, alfabeto, transicoes, inicial, finais)
+    no_inicial = encadear_tabela(tabela, colunas, finais_idx)
+
+    def aceita(cadeia):
+        no = no_inicial
+        try:
+            for c in cadeia:
+                no = no[c]
+        except KeyError:
+            # símbolo fora do alfabeto, transição indefinida ou estado morto
+            return False
+        return MARCA_FINAL in no
+
+    _guardar_lru(_cache_encadeados, chave, aceita)
+    return aceita
+
+def encadear_afd_arquivo(caminho_afd):
+    """
+    Lê o AFD com ler_afd e devolve o verificador de encadear_afd.
+    O resultado fica em cache enquanto o mtime e o tamanho do arquivo não mudarem
+    """
+    info = os.stat(caminho_afd)
+    chave = os.path.abspath(caminho_afd)
+    em_cache = _buscar_lru(_cache_arquivos, chave)
+    if em_cache and em_cache[0] == info.st_mtime_ns and em_cache[1] == info.st_size:
+        return em_cache[2]
+
+    estados, alfabeto, transicoes, inicial, finais = ler_afd(caminho_afd)
+    aceita = encadear_afd(estados, alfabeto, transicoes, inicial, finais)
+    _guardar_lru(_cache_arquivos, chave, (info.st_mtime_ns, info.st_size, aceita))
+    return aceita
@@ -117,13 +117,15 @@ def remover_transicao_vazia(estados, alfabeto_sem_epslon, estado_inicial, afn_ep
     inicio_afd = frozenset(afn_epslon[estado_inicial].get("fecho", {estado_inicial}))
     return afn, inicio_afd
 
-def converter_afn_afd(alfabeto, inicio_afd, estados_finais, afn):
+def converter_afn_afd(alfabeto, inicio_afd, estados_finais, afn, verboso=True):
     """
     Essa função faz a conversão do NFA sem transições vazias no DFA 
+    Com verboso=False as transições calculadas não são impressas
     """
 
     # O estado inicial do AFD é o conjunto dos subconjuntos iniciais do AFN (ou seja, o fecho(estado_inicial))
     estados_afd = [inicio_afd]      
+    vistos = {inicio_afd}  # espelha estados_afd para busca em O(1)
     transicoes_afd = defaultdict(lambda: defaultdict(set))
     finais_afd = set()
 
@@ -145,15 +147,18 @@ def converter_afn_afd(alfabeto, inicio_afd, estados_finais, afn):
             target = frozenset(target)
 
             transicoes_afd[estado_atual][a] = target
-            print(f"  δ({set(estado_atual)}, '{a}') = {set(target)}")
+            if verboso:
+                print(f"  δ({set(estado_atual)}, '{a}') = {set(target)}")
 
             # Se for um subconjunto novo, adiciona à lista
             if target:
                 transicoes_afd[estado_atual][a] = target
-                if target not in estados_afd:
+                if target not in vistos:
+                    vistos.add(target)
                     estados_afd.append(target)
 
-        print("") 
+        if verboso:
+            print("") 
         idx += 1  
 
     return estados_afd, inicio_afd, finais_afd, transicoes_afd
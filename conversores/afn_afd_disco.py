@@ -0,0 +1,160 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from conversores.afn_afd import extrair_afn_arquivo, calcular_afn_fecho, remover_transicao_vazia
+
+# ★★★★★★★★★★★★★★★★#
+#  DETERMINIZAÇÃO EM DISCO #
+# ★★★★★★★★★★★★★★★★#
+
+# Para AFNs cuja construção de subconjuntos gera milhões de estados, a versão em memória
+# (converter_afn_afd) mantém estados_afd e transicoes_afd inteiros na RAM.
+# Aqui o índice subconjunto -> id e a fila da BFS ficam em um banco sqlite, as transições
+# vão direto para o arquivo de saída e só um lote de estados é processado por vez
+
+# estimativa grosseira de bytes por nome de estado do AFN dentro de um subconjunto (str + set)
+BYTES_POR_ELEMENTO = 80
+BYTES_POR_ESTADO = 200
+
+def chave_subconjunto(subconjunto):
+    # a chave já é o texto usado no arquivo entre as chaves: 'q0, q1'
+    return ', '.join(sorted(subconjunto))
+
+def subconjunto_da_chave(chave):
+    return frozenset(chave.split(', ')) if chave else frozenset()
+
+def calcular_tamanho_lote(limite_memoria_mb, alfabeto, n_estados_afn):
+    """
+    Quantos estados do AFD cabem em um lote dentro do orçamento de RAM, considerando o pior caso:
+    cada subconjunto (origem e um destino por símbolo) pode conter todos os estados do AFN
+    """
+    custo_subconjunto = BYTES_POR_ESTADO + BYTES_POR_ELEMENTO * max(1, n_estados_afn)
+    custo_estado = custo_subconjunto * (1 + len(alfabeto))
+    # metade do orçamento para o lote, metade para o cache de páginas do sqlite
+    return max(1, (limite_memoria_mb * 1024 * 1024 // 2) // custo_estado)
+
+def eh_final(subconjunto, estados_finais):
+    # o subconjunto é final se contém algum final do AFN (gravado como 0/1 no banco)
+    return int(not estados_finais.isdisjoint(subconjunto))
+
+def abrir_banco(caminho_banco, limite_memoria_mb):
+    banco = sqlite3.connect(caminho_banco)
+    # banco temporário: durabilidade não importa, velocidade sim
+    banco.execute("PRAGMA journal_mode = OFF")
+    banco.execute("PRAGMA synchronous = OFF")
+    banco.execute(f"PRAGMA cache_size = -{max(1024, limite_memoria_mb * 1024 // 2)}")
+    banco.execute("DROP TABLE IF EXISTS estados")
+    banco.execute("""
+        CREATE TABLE estados (
+            id    INTEGER PRIMARY KEY,
+            chave TEXT NOT NULL UNIQUE,
+            final INTEGER NOT NULL
+        )
+    """)
+    return banco
+
+def converter_afn_afd_disco(alfabeto, inicio_afd, estados_finais, afn, caminho_afd,
+                            limite_memoria_mb=256, caminho_banco=None, n_estados_afn=None):
+    """
+    Mesma construção de subconjuntos de converter_afn_afd, mas fora da memória.
+    Os estados descobertos são numerados pelo sqlite na ordem da BFS (INSERT OR IGNORE),
+    então a fila é simplesmente `id > último processado`.
+    O AFD é gravado em caminho_afd no mesmo formato de salvar_afd_arquivo.
+    O banco e as transições intermediárias ficam em um diretório afd_disco_* de tempfile.gettempdir()
+    (respeita TMPDIR: aponte-o para um disco se /tmp for tmpfs); ele é removido no fim, mas uma
+    execução morta pelo SO (ex: OOM) o deixa para trás, fora de arquivos/saida.
+    Retorna (quantidade de estados, quantidade de finais)
+    """
+    if limite_memoria_mb < 1:
+        raise ValueError("limite_memoria_mb deve ser pelo menos 1")
+    alfabeto = sorted(alfabeto)
+    if n_estados_afn is None:
+        n_estados_afn = len(afn)
+    tamanho_lote = calcular_tamanho_lote(limite_memoria_mb, alfabeto, n_estados_afn)
+
+    dir_tmp = tempfile.mkdtemp(prefix='afd_disco_')
+    if caminho_banco is None:
+        caminho_banco = os.path.join(dir_tmp, 'subconjuntos.sqlite')
+    caminho_delta = os.path.join(dir_tmp, 'transicoes.txt')
+
+    banco = abrir_banco(caminho_banco, limite_memoria_mb)
+    try:
+        banco.execute("INSERT INTO estados (chave, final) VALUES (?, ?)",
+                      (chave_subconjunto(inicio_afd), eh_final(inicio_afd, estados_finais)))
+
+        ultimo = 0
+        with open(caminho_delta, 'w', encoding='utf-8') as delta:
+            while True:
+                lote = banco.execute(
+                    "SELECT id, chave FROM estados WHERE id > ? ORDER BY id LIMIT ?",
+                    (ultimo, tamanho_lote)).fetchall()
+                if not lote:
+                    break
+
+                novos = []
+                linhas = []
+                for _, chave in lote:
+                    estado_atual = subconjunto_da_chave(chave)
+                    for a in alfabeto:
+                        # Une todos os destinos de cada q ∈ estado_atual via a
+                        target = set()
+                        for q in estado_atual:
+                            target |= afn.get(q, {}).get(a, set())
+                        chave_destino = chave_subconjunto(target)
+                        linhas.append(f"{{{chave}}}, {a} -> {{{chave_destino}}}\n")
+                        # Assim como em converter_afn_afd, o subconjunto vazio não vira estado
+                        if target:
+                            novos.append((chave_destino, eh_final(target, estados_finais)))
+
+                delta.writelines(linhas)
+                banco.executemany("INSERT OR IGNORE INTO estados (chave, final) VALUES (?, ?)", novos)
+                banco.commit()
+                ultimo = lote[-1][0]
+
+        total = banco.execute("SELECT COUNT(*) FROM estados").fetchone()[0]
+        total_finais = banco.execute("SELECT COUNT(*) FROM estados WHERE final = 1").fetchone()[0]
+
+        # Monta o arquivo final em fluxo: Q e F vêm do banco, δ do arquivo temporário
+        with open(caminho_afd, 'w', encoding='utf-8') as f:
+            f.write("# AFD Determinizado\n")
+
+            f.write("Q: ")
+            consulta = banco.execute("SELECT chave FROM estados ORDER BY id")
+            for i, (chave,) in enumerate(consulta):
+                f.write(f"{', ' if i else ''}{{{chave}}}")
+            f.write("\n")
+
+            f.write(f"∑: {', '.join(alfabeto)}\n")
+
+            f.write("δ:\n")
+            with open(caminho_delta, 'r', encoding='utf-8') as delta:
+                shutil.copyfileobj(delta, f)
+
+            f.write(f"{{{chave_subconjunto(inicio_afd)}}}: inicial\n")
+
+            f.write("F: ")
+            consulta = banco.execute("SELECT chave FROM estados WHERE final = 1 ORDER BY id")
+            for i, (chave,) in enumerate(consulta):
+                f.write(f"{', ' if i else ''}{{{chave}}}")
+            f.write("\n")
+    finally:
+        banco.close()
+        shutil.rmtree(dir_tmp, ignore_errors=True)
+
+    return total, total_finais
+
+def converter_afn_disco(caminho_arquivo, nome_arquivo, limite_memoria_mb=256):
+    # afn epslon (original) -> afn fecho -> afn -> afd gravado direto do disco
+    estados, alfabeto, estado_inicial, estados_finais, afn_epslon = extrair_afn_arquivo(caminho_arquivo)
+    afn_fecho, alfabeto = calcular_afn_fecho(estados, afn_epslon, alfabeto)
+    afn, inicio_afd = remover_transicao_vazia(estados, alfabeto, estado_inicial, afn_fecho)
+
+    caminho_saida = f'./arquivos/saida/{nome_arquivo}'
+    print(f"\n--- AFD EM DISCO (orçamento: {limite_memoria_mb} MB) ---")
+    total, total_finais = converter_afn_afd_disco(alfabeto, inicio_afd, estados_finais, afn,
+                                                  caminho_saida, limite_memoria_mb,
+                                                  n_estados_afn=len(estados))
+    print(f"Estados do AFD: {total} | finais: {total_finais}")
+    print(f"\nArquivo salvo em {caminho_saida}")
@@ -1,6 +1,23 @@
 import re
 from collections import defaultdict
 
+# Regex para tratar o cabeçalho do arquivo e extrair elementos (compilada uma vez, no import)
+REGEX_CABECALHO = re.compile(
+    r"""
+    Gramática      
+    \s*:\s*        
+    G              
+    \s*=\s*\(      
+        \{\s*([^}]*)\s*\}         # grupo(1) = não-terminais entre chaves
+        \s*,\s*\{\s*([^}]*)\s*\}  # grupo(2) = terminais entre chaves
+        \s*,\s*P\s*,\s*           # ignora o “P”
+        ([^\s\)]+)                # grupo(3) = símbolo/estado inicial
+    \s*\)
+
+    """,
+    re.VERBOSE
+)
+
 def expandir_producoes_glud(linhas):
     """
     Recebe uma lista de strings no formato 'A -> x | yB | ε'
@@ -51,24 +68,7 @@ def extrair_glud_arquivo(caminho_arquivo):
 
             producoes_arquivo.append(conteudo)
 
-    # Regex para tratar aquivo e extrair elementos
-    regex = re.compile(
-        r"""
-        Gramática      
-        \s*:\s*        
-        G              
-        \s*=\s*\(      
-            \{\s*([^}]*)\s*\}         # grupo(1) = não-terminais entre chaves
-            \s*,\s*\{\s*([^}]*)\s*\}  # grupo(2) = terminais entre chaves
-            \s*,\s*P\s*,\s*           # ignora o “P”
-            ([^\s\)]+)                # grupo(3) = símbolo/estado inicial
-        \s*\)
-
-        """,
-        re.VERBOSE
-    )
-
-    cabecalho_regex = regex.search(cabecalho_arquivo)
+    cabecalho_regex = REGEX_CABECALHO.search(cabecalho_arquivo)
 
     nao_terminais = set()
     terminais = set()
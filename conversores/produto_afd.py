@@ -0,0 +1,142 @@
+from conversores.rev_comp import ler_afd
+from conversores.afd_compilado import tabelar_afd, estados_mortos
+
+# ★★★★★★★★★★★★★★★★#
+#     AFD PRODUTO         #
+# ★★★★★★★★★★★★★★★★#
+
+# Estado do produto = tupla com o estado (índice de tabelar_afd) de cada AFD, -1 quando aquele
+# AFD já rejeitou. Os estados são criados sob demanda, só quando alguma cadeia chega neles
+
+MORTO = -1
+
+def criar_produto_afd(afds, max_estados=100_000):
+    """
+    Monta o AFD produto (preguiçoso) de N AFDs no formato devolvido por ler_afd:
+    (estados, alfabeto, transicoes, inicial, finais).
+    tags[id] é a máscara de bits dos AFDs que aceitam no estado combinado id (bit k = afds[k]).
+    max_estados limita quantos estados combinados ficam em memória; ao atingir o limite o cache é descartado
+    """
+    if max_estados < 3:
+        raise ValueError("max_estados deve ser pelo menos 3")
+
+    componentes = [_tabelar_componente(afd) for afd in afds]
+    produto = {
+        'componentes': componentes,
+        'max_estados': max_estados,
+        'ids': {},          # tupla -> id
+        'tuplas': [],       # id -> tupla
+        'tags': [],         # id -> máscara de aceitação
+        'transicoes': [],   # id -> {símbolo: id | MORTO}
+        'descartes': 0,
+    }
+    _adicionar_estado(produto, tuple(inicial for _, _, _, inicial in componentes))
+    return produto
+
+def _tabelar_componente(afd):
+    """
+    Tabela de um AFD componente com os estados mortos (sorvedouros não finais, como o `{}`
+    gerado por converter_afn_afd) trocados por MORTO, para que o produto perceba cedo
+    quando aquele AFD já rejeitou. Retorna (tabela, colunas, finais_idx, inicial)
+    """
+    tabela, colunas, finais_idx = tabelar_afd(*afd)
+    mortos = estados_mortos(tabela, finais_idx)
+    if mortos:
+        tabela = [[MORTO if d in mortos else d for d in linha] for linha in tabela]
+    inicial = MORTO if 0 in mortos else 0
+    return tabela, colunas, finais_idx, inicial
+
+def _adicionar_estado(produto, tupla):
+    mascara = 0
+    for k, (s, (_, _, finais_idx, _)) in enumerate(zip(tupla, produto['componentes'])):
+        if s in finais_idx:
+            mascara |= 1 << k
+    novo = len(produto['tuplas'])
+    produto['ids'][tupla] = novo
+    produto['tuplas'].append(tupla)
+    produto['tags'].append(mascara)
+    produto['transicoes'].append({})
+    return novo
+
+def _descartar_cache(produto, manter):
+    """
+    Esvazia o cache de estados combinados preservando o inicial (id 0) e a tupla `manter`,
+    que é o estado corrente da cadeia em andamento. Devolve o novo id de `manter`
+    """
+    inicial = produto['tuplas'][0]
+    produto['ids'].clear()
+    produto['tuplas'].clear()
+    produto['tags'].clear()
+    produto['transicoes'].clear()
+    produto['descartes'] += 1
+    _adicionar_estado(produto, inicial)
+    if manter == inicial:
+        return 0
+    return _adicionar_estado(produto, manter)
+
+def _expandir(produto, atual, c):
+    """
+    Calcula δ(atual, c) no produto, criando o estado de destino se ainda não existir
+    """
+    tupla = produto['tuplas'][atual]
+    destino = []
+    vivo = False
+    for s, (tabela, colunas, _, _) in zip(tupla, produto['componentes']):
+        j = colunas.get(c)
+        d = tabela[s][j] if s != MORTO and j is not None else MORTO
+        destino.append(d)
+        vivo = vivo or d != MORTO
+
+    if not vivo:
+        produto['transicoes'][atual][c] = MORTO
+        return atual, MORTO
+
+    destino = tuple(destino)
+    prox = produto['ids'].get(destino)
+    if prox is None:
+        if len(produto['tuplas']) >= produto['max_estados']:
+            atual = _descartar_cache(produto, tupla)
+        prox = _adicionar_estado(produto, destino)
+    produto['transicoes'][atual][c] = prox
+    return atual, prox
+
+def verificar_cadeia_produto(produto, cadeia):
+    """
+    Percorre a cadeia uma única vez e devolve a máscara dos AFDs que a aceitam (0 = nenhum)
+    """
+    transicoes = produto['transicoes']
+    atual = 0
+    for c in cadeia:
+        prox = transicoes[atual].get(c)
+        if prox is None:
+            # o cache pode ter sido descartado, então `atual` pode mudar de id
+            atual, prox = _expandir(produto, atual, c)
+        if prox == MORTO:
+            return 0
+        atual = prox
+    return produto['tags'][atual]
+
+def verificar_lote_produto(produto, cadeias):
+    """
+    Interface em fluxo: consome qualquer iterável de cadeias e produz (cadeia, máscara) uma a uma
+    """
+    for cadeia in cadeias:
+        yield cadeia, verificar_cadeia_produto(produto, cadeia)
+
+def aceitos_da_mascara(mascara, nomes):
+    """
+    Lista os nomes dos AFDs cujos bits estão ligados na máscara
+    """
+    return [n for k, n in enumerate(nomes) if mascara >> k & 1]
+
+def verificar_arquivo_produto(caminho_cadeias, caminhos_afd, max_estados=100_000):
+    # uma cadeia por linha; linhas vazias representam a cadeia vazia
+    produto = criar_produto_afd([ler_afd(c) for c in caminhos_afd], max_estados)
+
+    with open(caminho_cadeias, 'r', encoding='utf-8') as f:
+        cadeias = (linha.rstrip('\n') for linha in f)
+        for cadeia, mascara in verificar_lote_produto(produto, cadeias):
+            aceitos = aceitos_da_mascara(mascara, caminhos_afd)
+            print(f"{cadeia}: {', '.join(aceitos) if aceitos else 'REJEITA'}")
+
+    print(f"\nEstados combinados: {len(produto['tuplas'])} | descartes de cache: {produto['descartes']}")
@@ -0,0 +1,324 @@
+import re
+from collections import defaultdict
+
+from conversores.afn_afd import calcular_afn_fecho, remover_transicao_vazia, converter_afn_afd
+from conversores.glud_afn import salvar_afn_arquivo
+
+# ★★★★★★★★★★★★★★★★#
+#    PARSER DE REGEX      #
+# ★★★★★★★★★★★★★★★★#
+
+# Operadores aceitos: união `|`, concatenação implícita, `*`, `+`, `?`, parênteses
+# e `ε` para a cadeia vazia
+OPERADORES = set('|*+?()')
+# Metacaracteres comuns de outras sintaxes de regex que não são suportados aqui;
+# aceitá-los como literais daria respostas erradas em silêncio
+NAO_SUPORTADOS = set('.[]{}^$')
+# Caracteres que só viram símbolo literal quando escapados com `\`
+ESPECIAIS = OPERADORES | NAO_SUPORTADOS | {'\\'}
+
+# Combinação de repetições aninhadas: (x*)+ = x*, (x?)? = x?, (x+)? = x*, ...
+# Evita que `a***...` gere uma árvore tão profunda quanto o número de operadores
+COMBINAR_REPETICAO = {
+    ('estrela', 'estrela'): 'estrela', ('estrela', 'mais'): 'estrela', ('estrela', 'opc'): 'estrela',
+    ('mais', 'estrela'): 'estrela', ('mais', 'mais'): 'mais', ('mais', 'opc'): 'estrela',
+    ('opc', 'estrela'): 'estrela', ('opc', 'mais'): 'estrela', ('opc', 'opc'): 'opc',
+}
+
+# Símbolos que sobrevivem à ida e volta pelos arquivos texto: extrair_afn_arquivo separa por
+# `,`, `->` e `:`, e REGEX_TRANSICAO de ler_afd só reconhece símbolos `\w`.
+# Os demais (ex: `\.` ou `-`) funcionam em memória, mas não podem ser gravados por converter_regex
+REGEX_SIMBOLO_ARQUIVO = re.compile(r'\w')
+
+def _fechar_grupo(alternativas, atual):
+    """
+    Monta o nó de um grupo a partir das alternativas já fechadas e da concatenação corrente.
+    União e concatenação são n-árias, então `abc...` não cria aninhamento
+    """
+    alternativas = alternativas + [atual]
+    filhos = []
+    for itens in alternativas:
+        if not itens:
+            filhos.append(('vazio',))
+        elif len(itens) == 1:
+            filhos.append(itens[0])
+        else:
+            filhos.append(('conc', itens))
+    return filhos[0] if len(filhos) == 1 else ('uniao', filhos)
+
+def parsear_regex(padrao):
+    """
+    Converte a expressão regular em uma árvore sintática de tuplas:
+    ('simb', posição, a), ('vazio',), ('uniao', [filhos]), ('conc', [filhos]),
+    ('estrela', x), ('mais', x), ('opc', x).
+    Cada símbolo recebe uma posição (1, 2, ...) usada na construção de Glushkov.
+    O parser é iterativo (pilha explícita de grupos), então padrões longos não estouram a recursão.
+    Retorna (arvore, simbolo_por_posicao)
+    """
+    simbolos = {}
+    # cada grupo aberto guarda (alternativas fechadas, concatenação corrente)
+    pilha = []
+    alternativas, atual = [], []
+    i = 0
+
+    def erro(msg):
+        raise ValueError(f"Regex inválida '{padrao}' (posição {i}): {msg}")
+
+    while i < len(padrao):
+        c = padrao[i]
+        if c == '(':
+            pilha.append((alternativas, atual))
+            alternativas, atual = [], []
+        elif c == ')':
+            if not pilha:
+                erro("parêntese fechado sem abertura")
+            no = _fechar_grupo(alternativas, atual)
+            alternativas, atual = pilha.pop()
+            atual.append(no)
+        elif c == '|':
+            alternativas.append(atual)
+            atual = []
+        elif c in '*+?':
+            if not atual:
+                erro(f"operador '{c}' sem operando")
+            op = {'*': 'estrela', '+': 'mais', '?': 'opc'}[c]
+            no = atual[-1]
+            if no[0] == 'vazio':
+                pass  # ε* = ε+ = ε? = ε
+            elif no[0] in ('estrela', 'mais', 'opc'):
+                atual[-1] = (COMBINAR_REPETICAO[no[0], op], no[1])
+            else:
+                atual[-1] = (op, no)
+        elif c == 'ε':
+            atual.append(('vazio',))
+        elif c in NAO_SUPORTADOS:
+            erro(f"metacaractere '{c}' não suportado (use \\{c} para o símbolo literal)")
+        else:
+            if c == '\\':
+                i += 1
+                if i >= len(padrao):
+                    erro("escape no fim da expressão")
+                c = padrao[i]
+                if c == 'ε':
+                    erro("ε não pode ser usado como símbolo, pois é a transição vazia do AFN")
+                if c not in ESPECIAIS:
+                    erro(f"escape '\\{c}' não suportado")
+            pos = len(simbolos) + 1
+            simbolos[pos] = c
+            atual.append(('simb', pos, c))
+        i += 1
+
+    if pilha:
+        erro("parêntese não fechado")
+    return _fechar_grupo(alternativas, atual), simbolos
+
+# ★★★★★★★★★★★★★★★★#
+#  CONSTRUÇÃO GLUSHKOV    #
+# ★★★★★★★★★★★★★★★★#
+
+def _filhos(no):
+    if no[0] in ('uniao', 'conc'):
+        return no[1]
+    if no[0] in ('estrela', 'mais', 'opc'):
+        return [no[1]]
+    return []
+
+def calcular_glushkov(arvore):
+    """
+    Calcula, para a árvore inteira, se aceita ε (anulável), as posições iniciais (first),
+    as posições finais (last) e o conjunto follow[p] de posições que podem seguir p.
+    Percorre a árvore em pós-ordem com pilha explícita, sem recursão
+    """
+    follow = defaultdict(set)
+    pilha = [(arvore, False)]
+    resultados = []  # (anulável, first, last) dos nós já visitados, na ordem da pós-ordem
+
+    while pilha:
+        no, expandido = pilha.pop()
+        filhos = _filhos(no)
+        if not expandido and filhos:
+            pilha.append((no, True))
+            for filho in reversed(filhos):
+                pilha.append((filho, False))
+            continue
+
+        tipo = no[0]
+        if tipo == 'vazio':
+            resultados.append((True, set(), set()))
+            continue
+        if tipo == 'simb':
+            resultados.append((False, {no[1]}, {no[1]}))
+            continue
+
+        parciais = resultados[-len(filhos):]
+        del resultados[-len(filhos):]
+
+        if tipo == 'uniao':
+            anulavel, first, last = False, set(), set()
+            for n, f, l in parciais:
+                anulavel = anulavel or n
+                first |= f
+                last |= l
+        elif tipo == 'conc':
+            anulavel, first, last = True, set(), set()
+            for n, f, l in parciais:
+                # toda posição que pode terminar o prefixo pode ser seguida pelas iniciais do próximo
+                for p in last:
+                    follow[p] |= f
+                if anulavel:
+                    first |= f
+                last = last | l if n else set(l)
+                anulavel = anulavel and n
+        else:
+            # estrela, mais e opc compartilham first/last do operando
+            n, first, last = parciais[0]
+            if tipo in ('estrela', 'mais'):
+                for p in last:
+                    follow[p] |= first
+            anulavel = n or tipo != 'mais'
+        resultados.append((anulavel, first, last))
+
+    anulavel, first, last = resultados[0]
+    return anulavel, first, last, follow
+
+def regex_para_afn(padrao, prefixo='p'):
+    """
+    Constrói o AFN sem transições ε de Glushkov para a regex: um estado por posição
+    mais o estado inicial `{prefixo}0`.
+    Retorna no mesmo formato de extrair_afn_arquivo:
+    (estados, alfabeto, estado_inicial, estados_finais, afn_epslon)
+    """
+    arvore, simbolos = parsear_regex(padrao)
+    anulavel, first, last, follow = calcular_glushkov(arvore)
+
+    nome = lambda pos: f"{prefixo}{pos}"
+    estado_inicial = nome(0)
+    estados = {estado_inicial} | {nome(p) for p in simbolos}
+    alfabeto = set(simbolos.values())
+    afn_epslon = defaultdict(lambda: defaultdict(set))
+
+    for p in first:
+        afn_epslon[estado_inicial][simbolos[p]].add(nome(p))
+    for p, seguintes in follow.items():
+        for q in seguintes:
+            afn_epslon[nome(p)][simbolos[q]].add(nome(q))
+
+    estados_finais = {nome(p) for p in last}
+    if anulavel:
+        estados_finais.add(estado_inicial)
+
+    return estados, alfabeto, estado_inicial, estados_finais, afn_epslon
+
+def regex_para_afd(padrao):
+    """
+    Regex -> AFN de Glushkov -> AFD, reaproveitando o pipeline de afn_afd.
+    Retorna no mesmo formato de ler_afd: (estados, alfabeto, transicoes, inicial, finais),
+    com transicoes[origem][simbolo] = {destino}
+    """
+    estados, alfabeto, estado_inicial, estados_finais, afn_epslon = regex_para_afn(padrao)
+    afn_fecho, alfabeto = calcular_afn_fecho(estados, afn_epslon, alfabeto)
+    afn, inicio_afd = remover_transicao_vazia(estados, alfabeto, estado_inicial, afn_fecho)
+    estados_afd, inicio_afd, finais_afd, transicoes_afd = converter_afn_afd(
+        alfabeto, inicio_afd, estados_finais, afn, verboso=False)
+
+    transicoes = defaultdict(lambda: defaultdict(set))
+    for origem, mapa in transicoes_afd.items():
+        for simbolo, destino in mapa.items():
+            transicoes[origem][simbolo].add(destino)
+    return set(estados_afd), frozenset(alfabeto), transicoes, inicio_afd, finais_afd
+
+# ★★★★★★★★★★★★★★★★#
+#     MULTIPADRÃO         #
+# ★★★★★★★★★★★★★★★★#
+
+def compilar_multipadrao(padroes):
+    """
+    Compila vários padrões em um único AFD com marcação (tags).
+    Os AFNs de Glushkov de cada padrão (estados prefixados por r{k}_) são unidos e determinizados juntos;
+    tags[estado] é a máscara de bits dos padrões aceitos naquele estado (bit k = padroes[k]).
+    Retorna (alfabeto, transicoes_afd, inicio_afd, tags)
+    """
+    if not padroes:
+        raise ValueError("compilar_multipadrao precisa de pelo menos um padrão")
+
+    estados = set()
+    alfabeto = set()
+    iniciais = set()
+    finais_por_padrao = []
+    afn_epslon = defaultdict(lambda: defaultdict(set))
+
+    for k, padrao in enumerate(padroes):
+        est, alf, ini, fin, trans = regex_para_afn(padrao, prefixo=f"r{k}_p")
+        estados |= est
+        alfabeto |= alf
+        iniciais.add(ini)
+        finais_por_padrao.append(fin)
+        for origem, mapa in trans.items():
+            for simb, dests in mapa.items():
+                afn_epslon[origem][simb] |= dests
+
+    afn_fecho, alfabeto = calcular_afn_fecho(estados, afn_epslon, alfabeto)
+    # O estado inicial passado aqui só define o inicio_afd devolvido, que é descartado: os AFNs
+    # de Glushkov não têm transições ε, então o fecho de cada inicial é ele mesmo e o início
+    # do AFD unido é simplesmente o conjunto dos iniciais de todos os padrões
+    afn, _ = remover_transicao_vazia(estados, alfabeto, next(iter(iniciais)), afn_fecho)
+    inicio_afd = frozenset(iniciais)
+    todos_finais = set().union(*finais_por_padrao)
+    estados_afd, inicio_afd, _, transicoes_afd = converter_afn_afd(
+        alfabeto, inicio_afd, todos_finais, afn, verboso=False)
+
+    tags = {}
+    for estado in estados_afd:
+        mascara = 0
+        for k, finais in enumerate(finais_por_padrao):
+            if not finais.isdisjoint(estado):
+                mascara |= 1 << k
+        if mascara:
+            tags[estado] = mascara
+
+    return alfabeto, transicoes_afd, inicio_afd, tags
+
+def varrer_multipadrao(transicoes_afd, inicio_afd, tags, cadeia):
+    """
+    Percorre a cadeia uma única vez no AFD multipadrão e devolve a máscara dos padrões que a aceitam
+    """
+    atual = inicio_afd
+    for c in cadeia:
+        atual = transicoes_afd.get(atual, {}).get(c)
+        # símbolo fora do alfabeto ou subconjunto vazio: nenhum padrão aceita
+        if not atual:
+            return 0
+    return tags.get(atual, 0)
+
+def padroes_da_mascara(mascara, padroes):
+    """
+    Lista os padrões cujos bits estão ligados na máscara
+    """
+    return [p for k, p in enumerate(padroes) if mascara >> k & 1]
+
+def converter_regex(padrao, nome_arquivo):
+    # regex -> afn de glushkov, salvo no formato lido por `main.py afn`
+    estados, alfabeto, estado_ini, estados_finais, transicoes = regex_para_afn(padrao)
+    invalidos = sorted(a for a in alfabeto if not REGEX_SIMBOLO_ARQUIVO.fullmatch(a))
+    if invalidos:
+        raise ValueError(f"Símbolos {', '.join(map(repr, invalidos))} de '{padrao}' não podem ser gravados "
+                         "no arquivo do AFN; use apenas letras, dígitos e '_'")
+    print("\n--- REGEX ---")
+    print(padrao)
+
+    print("\n--- AFND GLUSHKOV ---")
+    ordem = lambda q: int(q[1:])
+    print(f"Q: {', '.join(sorted(estados, key=ordem))}")
+    print(f"Σ: {', '.join(sorted(alfabeto))}")
+    print("δ:")
+    for esq, mapa in transicoes.items():
+        for simbolo, destinos in mapa.items():
+            for dest in sorted(destinos, key=ordem):
+                print(f" {esq}, {simbolo} -> {dest}")
+    print(f"{estado_ini}: inicial")
+    print(f"F: {', '.join(sorted(estados_finais, key=ordem))}")
+
+    caminho_saida = f'./arquivos/saida/{nome_arquivo}'
+    salvar_afn_arquivo(sorted(estados, key=ordem), sorted(alfabeto), transicoes, estado_ini,
+                       ', '.join(sorted(estados_finais, key=ordem)), caminho_saida)
+    print(f"\nArquivo salvo em {caminho_saida}")
@@ -1,6 +1,17 @@
 from collections import defaultdict, deque
+import marshal
+import os
 import re
 
+# Regexes de leitura do AFD, compiladas uma única vez no import do módulo
+REGEX_ESTADO = re.compile(r'\{[^{}]*\}')
+REGEX_TRANSICAO = re.compile(r'(\{[^{}]*\})\s*,\s*(\w)\s*->\s*(\{[^{}]*\})')
+
+# Snapshot binário do AFD: arquivo `<afd>.snapshot` ao lado do texto, no formato marshal
+# (embutido no interpretador, então não acrescenta custo de import)
+EXTENSAO_SNAPSHOT = '.snapshot'
+VERSAO_SNAPSHOT = (1, marshal.version)
+
 # ★★★★★★★★★★★★★★★★#
 #    LEITURA DE AFD       #
 # ★★★★★★★★★★★★★★★★#
@@ -36,7 +47,7 @@ def ler_afd(caminho_arquivo):
 
     # extrai conjunto de estados lendo todas as substrings do tipo {...}
     # usando frozenset pq é hashable
-    estados_raw = re.findall(r'\{[^{}]*\}', linhas[0])
+    estados_raw = REGEX_ESTADO.findall(linhas[0])
     for s in estados_raw:
         estados.add(remover_caracteres_estado(s))
 
@@ -48,7 +59,7 @@ def ler_afd(caminho_arquivo):
         if ': inicial' in linha:
             estado_inicial = remover_caracteres_estado(linha.split(':')[0])
             break
-        match = re.match(r'(\{[^{}]*\})\s*,\s*(\w)\s*->\s*(\{[^{}]*\})', linha)
+        match = REGEX_TRANSICAO.match(linha)
         if match:
             origem, simbolo, destino = match.groups()
             transicoes[remover_caracteres_estado(origem)][simbolo].add(remover_caracteres_estado(destino))
@@ -56,12 +67,55 @@ def ler_afd(caminho_arquivo):
 
     i += 1
     if i < len(linhas) and linhas[i].startswith("F:"):
-        finais_raw = re.findall(r'\{[^{}]*\}', linhas[i])
+        finais_raw = REGEX_ESTADO.findall(linhas[i])
         for s in finais_raw:
             estados_finais.add(remover_caracteres_estado(s))
 
     return estados, alfabeto, transicoes, estado_inicial, estados_finais
 
+def ler_afd_snapshot(caminho_arquivo):
+    """
+    Igual a ler_afd, mas reaproveita o snapshot `<caminho>.snapshot` quando ele foi gerado
+    a partir do mesmo arquivo (mesmo mtime e tamanho), pulando o parsing do texto.
+    Se o snapshot não existir ou estiver desatualizado, lê o texto e grava um novo
+    """
+    info = os.stat(caminho_arquivo)
+    caminho_snapshot = caminho_arquivo + EXTENSAO_SNAPSHOT
+    chave = (VERSAO_SNAPSHOT, info.st_mtime_ns, info.st_size)
+
+    try:
+        with open(caminho_snapshot, 'rb') as f:
+            snapshot = marshal.loads(f.read())
+        if snapshot['chave'] == chave:
+            estados, alfabeto, trans_simples, estado_inicial, estados_finais = snapshot['afd']
+            transicoes = defaultdict(lambda: defaultdict(set))
+            for origem, mapa in trans_simples.items():
+                transicoes[origem].update(mapa)
+            return estados, alfabeto, transicoes, estado_inicial, estados_finais
+    except (OSError, EOFError, KeyError, ValueError, TypeError):
+        pass
+
+    estados, alfabeto, transicoes, estado_inicial, estados_finais = ler_afd(caminho_arquivo)
+
+    # marshal só serializa tipos embutidos: o defaultdict é gravado como dicionários simples
+    trans_simples = {origem: dict(mapa) for origem, mapa in transicoes.items()}
+    snapshot = {'chave': chave, 'afd': (estados, alfabeto, trans_simples, estado_inicial, estados_finais)}
+    # grava em um temporário no mesmo diretório e troca com os.replace (atômico):
+    # execuções paralelas nunca leem um snapshot pela metade nem misturam escritas
+    # (nome único via pid + sufixo aleatório; tempfile não é usado por ser caro de importar)
+    caminho_tmp = f"{caminho_snapshot}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+    try:
+        fd = os.open(caminho_tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(marshal.dumps(snapshot))
+        os.replace(caminho_tmp, caminho_snapshot)
+    except OSError:
+        # sem permissão de escrita: segue sem snapshot
+        if os.path.exists(caminho_tmp):
+            os.remove(caminho_tmp)
+
+    return estados, alfabeto, transicoes, estado_inicial, estados_finais
+
 # ★★★★★★★★★★★★★★★★#
 #       REVERSO           #
 # ★★★★★★★★★★★★★★★★#
@@ -82,16 +136,18 @@ def reverso_afn(transicoes_dfa, estado_inicial_dfa, estados_finais_dfa):
     finais_rev = {estado_inicial_dfa}
     return transicoes_rev, iniciais_rev, finais_rev
 
-def verificar_cadeia_afn(cadeia, alfabeto, transicoes_afn, estados_iniciais, estados_finais):
+def verificar_cadeia_afn(cadeia, alfabeto, transicoes_afn, estados_iniciais, estados_finais, verboso=True):
     """
     Simula um AFN (sem ε) sobre a cadeia.
+    Com verboso=False símbolos inválidos rejeitam sem imprimir aviso.
     """
     # conjunto atual com todos os estados inciiais
     atual = set(estados_iniciais)
     for c in cadeia:
         # verifica se c pertence ao afabeto
         if c not in alfabeto:
-            print(f"Símbolo inválido: '{c}'")
+            if verboso:
+                print(f"Símbolo inválido: '{c}'")
             return False
         prox = set()
         for q in atual:
@@ -142,17 +198,19 @@ def complemento_afd(estados, alfabeto, transicoes, estado_inicial, estados_finai
     return estados2, alfabeto, transicoes2, estado_inicial, novos_finais
 
 
-def verificar_cadeia_afd(transicoes, inicial, finais, cadeia):
+def verificar_cadeia_afd(transicoes, inicial, finais, cadeia, verboso=True):
     """
     Simula uma cadeia w num DFA determinístico completo
     - Sempre há no máximo 1 estado corrente
     - Transições não definidas levam à rejeição imediata (trap state)
+    - Com verboso=False a rejeição não imprime aviso
     """
     atual = inicial
     for c in cadeia:
         # símbolo fora do alfabeto ou sem transição definida: rejeita
         if c not in transicoes[atual]:
-            print(f"Símbolo inválido: '{c}'")
+            if verboso:
+                print(f"Símbolo inválido: '{c}'")
             return False
         destinos = transicoes[atual][c]
         # pega o único destino
@@ -222,8 +280,11 @@ def salvar_automato_arquivo(estados, alfabeto, transicoes,
                             for e in finals_clean)
         f.write(f"F: {fin_str}\n")
 
-def aplicar_reverso_complemento_afd(caminho_afd, arquivo_comp, arquivo_rev, cadeia):
-    estados, alfabeto, transicoes, inicial, finais = ler_afd(caminho_afd)
+def aplicar_reverso_complemento_afd(caminho_afd, arquivo_comp, arquivo_rev, cadeia, usar_snapshot=False):
+    if usar_snapshot:
+        estados, alfabeto, transicoes, inicial, finais = ler_afd_snapshot(caminho_afd)
+    else:
+        estados, alfabeto, transicoes, inicial, finais = ler_afd(caminho_afd)
     print('--- AFD ORIGINAL ---')
     print('\nQ: ' + ', '.join(formatar_estado(q) for q in sorted(estados, key=lambda s: sorted(s))))
     print('\n∑: ' + ', '.join(sorted(alfabeto)))
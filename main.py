@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 import sys
-from conversores.glud_afn import converter_glud
-from conversores.afn_afd import converter_afn
-from conversores.rev_comp import aplicar_reverso_complemento_afd
+
+# Os conversores são importados dentro de cada operação (import preguiçoso):
+# cada execução só paga o import e a compilação de regexes do módulo que usa
 
 USO = """
 Uso:
   script.py glud <entrada> <saida>
-  script.py afn  <entrada> <saida>
-  script.py afd  <entrada> <saida_complemento> <saida_reverso> <cadeia>
+  script.py afn  <entrada> <saida> [--disco[=MB]]
+  script.py afd  <entrada> <saida_complemento> <saida_reverso> <cadeia> [--snapshot]
+  script.py regex <padrao> <saida>
+  script.py produto <arquivo_cadeias> <afd1> [<afd2> ...] [--max-estados=N]
+  script.py servir <porta | unix:caminho> [nome=afd ...]
 """
 
 def main():
@@ -22,17 +25,73 @@ def main():
     # ex: python main.py glud arquivos/entrada/exemplo_apr.txt exemplo_apr_afn.txt
     if operacao == 'glud':
         _, entrada, saida = args
+        from conversores.glud_afn import converter_glud
         converter_glud(entrada, saida)
 
     # ex: python main.py afn arquivos/saida/exemplo_apr_afn.txt exemplo_apr_afd.txt
+    # com --disco[=MB] a determinização roda fora da memória (sqlite) dentro do orçamento de RAM
     elif operacao == 'afn':
-        _, entrada, saida = args
-        converter_afn(entrada, saida)
+        flags = [a for a in args if a.startswith('--')]
+        posicionais = [a for a in args if not a.startswith('--')]
+        mb = None
+        for flag in flags:
+            nome, _, valor = flag.partition('=')
+            if nome != '--disco' or (valor and not (valor.isdigit() and int(valor) >= 1)):
+                print(f"opção inválida '{flag}': afn aceita apenas --disco ou --disco=MB (inteiro >= 1)")
+                print(USO)
+                sys.exit(1)
+            mb = int(valor) if valor else 256
+        if len(posicionais) != 3:
+            print(USO)
+            sys.exit(1)
+        _, entrada, saida = posicionais
+        if mb is not None:
+            from conversores.afn_afd_disco import converter_afn_disco
+            converter_afn_disco(entrada, saida, mb)
+        else:
+            from conversores.afn_afd import converter_afn
+            converter_afn(entrada, saida)
 
     # ex: python main.py afd arquivos/saida/exemplo_apr_afd.txt exemplo_apr_comp.txt exemplo_apr_rev.txt aa
+    # com --snapshot o AFD é carregado de <entrada>.snapshot (marshal) quando este estiver atualizado
     elif operacao == 'afd':
-        _, entrada, comp, rev, cadeia = args
-        aplicar_reverso_complemento_afd(entrada, comp, rev, cadeia)
+        usar_snapshot = '--snapshot' in args
+        _, entrada, comp, rev, cadeia = [a for a in args if a != '--snapshot']
+        from conversores.rev_comp import aplicar_reverso_complemento_afd
+        aplicar_reverso_complemento_afd(entrada, comp, rev, cadeia, usar_snapshot)
+
+    # ex: python main.py regex "(ab|c)*a?" exemplo_regex_afn.txt
+    elif operacao == 'regex':
+        _, padrao, saida = args
+        from conversores.regex_afn import converter_regex
+        converter_regex(padrao, saida)
+
+    # ex: python main.py produto cadeias.txt arquivos/saida/afd_saida.txt arquivos/entrada/afd_teste.txt
+    # com --max-estados=N limita os estados combinados mantidos em memória (padrão 100000)
+    elif operacao == 'produto':
+        limite = [a for a in args if a.startswith('--max-estados=')]
+        posicionais = [a for a in args if not a.startswith('--max-estados=')]
+        if len(posicionais) < 3:
+            print("produto precisa do arquivo de cadeias e de pelo menos um AFD")
+            print(USO)
+            sys.exit(1)
+        _, cadeias, *afds = posicionais
+        max_estados = 100_000
+        if limite:
+            valor = limite[0].partition('=')[2]
+            if not valor.isdigit() or int(valor) < 3:
+                print("--max-estados deve ser um inteiro >= 3")
+                print(USO)
+                sys.exit(1)
+            max_estados = int(valor)
+        from conversores.produto_afd import verificar_arquivo_produto
+        verificar_arquivo_produto(cadeias, afds, max_estados)
+
+    # ex: python main.py servir 8765 saida=arquivos/saida/afd_saida.txt
+    elif operacao == 'servir':
+        _, endereco, *automatos = args
+        from servico import servir
+        servir(endereco, automatos)
 
 if __name__ == "__main__":
     main()
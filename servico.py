@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Serviço asyncio de pertinência: carrega os AFDs uma única vez em um registro nomeado
+e responde consultas em lote sem reabrir o processo a cada cadeia.
+
+Protocolo: uma mensagem JSON por linha, tanto no pedido quanto na resposta.
+  {"op": "carregar", "nome": "x", "caminho": "arquivos/saida/afd_saida.txt"}
+  {"op": "verificar", "nome": "x", "modo": "afd" | "complemento" | "reverso", "cadeias": ["ab", "c"]}
+  {"op": "descarregar", "nome": "x"}
+  {"op": "listar"}
+  {"op": "metricas"}
+Respostas: {"ok": true, ...} ou {"ok": false, "erro": "..."}
+"""
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from collections import defaultdict, deque
+
+from conversores.rev_comp import ler_afd, complemento_afd, reverso_afn, verificar_cadeia_afn
+from conversores.afd_compilado import encadear_afd
+
+MODOS = ('afd', 'complemento', 'reverso')
+
+# quantas latências recentes são guardadas por operação para o cálculo dos percentis
+JANELA_LATENCIAS = 10_000
+# chave das métricas para pedidos que não passam na validação, qualquer que seja o `op` enviado
+OP_INVALIDO = 'invalido'
+
+# ★★★★★★★★★★★★★★★★#
+#       REGISTRO          #
+# ★★★★★★★★★★★★★★★★#
+
+def carregar_automato(caminho):
+    """
+    Lê o AFD e pré-computa as três formas consultáveis:
+    - afd / complemento: verificadores de encadear_afd (mesma semântica de verificar_cadeia_afd)
+    - reverso: AFN de reverso_afn, simulado com verificar_cadeia_afn
+    """
+    info = os.stat(caminho)
+    estados, alfabeto, transicoes, inicial, finais = ler_afd(caminho)
+    estados_comp, _, transicoes_comp, inicial_comp, finais_comp = complemento_afd(
+        estados, alfabeto, transicoes, inicial, finais)
+    trans_rev, iniciais_rev, finais_rev = reverso_afn(transicoes, inicial, finais)
+
+    return {
+        'caminho': caminho,
+        'mtime': info.st_mtime_ns,
+        'tamanho': info.st_size,
+        'recargas': 0,
+        'alfabeto': alfabeto,
+        'afd': encadear_afd(estados, alfabeto, transicoes, inicial, finais),
+        'complemento': encadear_afd(estados_comp, alfabeto, transicoes_comp, inicial_comp, finais_comp),
+        'reverso': (trans_rev, iniciais_rev, finais_rev),
+    }
+
+async def obter_automato(registro, nome):
+    """
+    Busca o autômato no registro, recarregando-o se o arquivo mudou (mtime ou tamanho) desde a última leitura.
+    A recarga roda em outra thread para não travar o laço de eventos dos demais clientes.
+    Nome não registrado levanta ValueError
+    """
+    entrada = registro.get(nome)
+    if entrada is None:
+        raise ValueError(f"autômato '{nome}' não registrado")
+
+    info = os.stat(entrada['caminho'])
+    if info.st_mtime_ns != entrada['mtime'] or info.st_size != entrada['tamanho']:
+        nova = await asyncio.to_thread(carregar_automato, entrada['caminho'])
+        nova['recargas'] = entrada['recargas'] + 1
+        registro[nome] = entrada = nova
+    return entrada
+
+def verificar_lote(entrada, modo, cadeias):
+    if modo == 'afd' or modo == 'complemento':
+        aceita = entrada[modo]
+        return [aceita(w) for w in cadeias]
+    if modo == 'reverso':
+        trans_rev, iniciais_rev, finais_rev = entrada['reverso']
+        alfabeto = entrada['alfabeto']
+        return [verificar_cadeia_afn(w, alfabeto, trans_rev, iniciais_rev, finais_rev, verboso=False)
+                for w in cadeias]
+    raise ValueError(f"modo inválido '{modo}', use um de {', '.join(MODOS)}")
+
+# ★★★★★★★★★★★★★★★★#
+#       MÉTRICAS          #
+# ★★★★★★★★★★★★★★★★#
+
+def criar_metricas():
+    return defaultdict(lambda: deque(maxlen=JANELA_LATENCIAS))
+
+def percentil(valores_ordenados, p):
+    # percentil pelo método nearest-rank
+    if not valores_ordenados:
+        return 0.0
+    k = math.ceil(p / 100 * len(valores_ordenados)) - 1
+    return valores_ordenados[max(0, k)]
+
+def resumir_metricas(metricas):
+    """
+    Resumo por operação das latências recentes em milissegundos: contagem, p50, p90, p99 e máximo
+    """
+    resumo = {}
+    for op, latencias in metricas.items():
+        ordenadas = sorted(latencias)
+        resumo[op] = {
+            'n': len(ordenadas),
+            'p50_ms': percentil(ordenadas, 50) * 1e3,
+            'p90_ms': percentil(ordenadas, 90) * 1e3,
+            'p99_ms': percentil(ordenadas, 99) * 1e3,
+            'max_ms': (ordenadas[-1] if ordenadas else 0.0) * 1e3,
+        }
+    return resumo
+
+# ★★★★★★★★★★★★★★★★#
+#       PROTOCOLO         #
+# ★★★★★★★★★★★★★★★★#
+
+# campos obrigatórios (e seus tipos) de cada operação
+CAMPOS = {
+    'carregar': {'nome': str, 'caminho': str},
+    'descarregar': {'nome': str},
+    'listar': {},
+    'verificar': {'nome': str, 'cadeias': list},
+    'metricas': {},
+}
+
+def validar_pedido(pedido):
+    """
+    Confere o formato do pedido antes de executá-lo; formatos inválidos levantam ValueError
+    """
+    if not isinstance(pedido, dict):
+        raise ValueError("o pedido deve ser um objeto JSON")
+    op = pedido.get('op')
+    if not isinstance(op, str) or op not in CAMPOS:
+        raise ValueError(f"operação desconhecida '{op}'")
+    for campo, tipo in CAMPOS[op].items():
+        if campo not in pedido:
+            raise ValueError(f"campo '{campo}' ausente")
+        if not isinstance(pedido[campo], tipo):
+            raise ValueError(f"campo '{campo}' deve ser do tipo {tipo.__name__}")
+    if op == 'verificar':
+        if not all(isinstance(w, str) for w in pedido['cadeias']):
+            raise ValueError("campo 'cadeias' deve ser uma lista de strings")
+        if pedido.get('modo', 'afd') not in MODOS:
+            raise ValueError(f"modo inválido '{pedido.get('modo')}', use um de {', '.join(MODOS)}")
+
+async def responder(registro, metricas, pedido):
+    """
+    Processa um pedido (JSON já decodificado) e devolve a resposta.
+    Não faz E/S de rede, então pode ser usada diretamente sem o servidor (ex: asyncio.run).
+    Qualquer erro vira {"ok": false, ...}: uma conexão nunca cai por causa de um pedido
+    """
+    inicio = time.perf_counter()
+    op = OP_INVALIDO
+    try:
+        validar_pedido(pedido)
+        op = pedido['op']
+        if op == 'carregar':
+            # leitura e montagem dos verificadores rodam fora do laço de eventos
+            registro[pedido['nome']] = await asyncio.to_thread(carregar_automato, pedido['caminho'])
+            resposta = {'ok': True}
+        elif op == 'descarregar':
+            registro.pop(pedido['nome'], None)
+            resposta = {'ok': True}
+        elif op == 'listar':
+            resposta = {'ok': True, 'automatos': {
+                nome: {'caminho': e['caminho'], 'recargas': e['recargas']}
+                for nome, e in registro.items()
+            }}
+        elif op == 'verificar':
+            entrada = await obter_automato(registro, pedido['nome'])
+            modo = pedido.get('modo', 'afd')
+            resposta = {'ok': True, 'resultados': verificar_lote(entrada, modo, pedido['cadeias'])}
+        else:
+            resposta = {'ok': True, 'latencias': resumir_metricas(metricas)}
+    except (OSError, ValueError, IndexError) as e:
+        resposta = {'ok': False, 'erro': str(e)}
+    except Exception as e:
+        # ex: RecursionError/MemoryError ao carregar um AFD grande demais
+        resposta = {'ok': False, 'erro': f"{type(e).__name__}: {e}"}
+
+    metricas[op].append(time.perf_counter() - inicio)
+    return resposta
+
+async def atender_conexao(registro, metricas, leitor, escritor):
+    try:
+        while True:
+            linha = await leitor.readline()
+            if not linha:
+                break
+            try:
+                pedido = json.loads(linha)
+            except json.JSONDecodeError as e:
+                resposta = {'ok': False, 'erro': f"JSON inválido: {e}"}
+            else:
+                resposta = await responder(registro, metricas, pedido)
+            escritor.write(json.dumps(resposta, ensure_ascii=False).encode('utf-8') + b'\n')
+            await escritor.drain()
+    finally:
+        escritor.close()
+
+async def iniciar_servico(registro=None, host='127.0.0.1', porta=0, caminho_socket=None):
+    """
+    Sobe o servidor em localhost (porta 0 = porta livre escolhida pelo SO) ou em um socket Unix.
+    Retorna (servidor, registro, metricas); o registro pode ser pré-carregado pelo chamador
+    """
+    registro = {} if registro is None else registro
+    metricas = criar_metricas()
+    atender = lambda leitor, escritor: atender_conexao(registro, metricas, leitor, escritor)
+
+    if caminho_socket:
+        servidor = await asyncio.start_unix_server(atender, path=caminho_socket)
+    else:
+        servidor = await asyncio.start_server(atender, host=host, port=porta)
+    return servidor, registro, metricas
+
+async def consultar(pedidos, host='127.0.0.1', porta=None, caminho_socket=None):
+    """
+    Cliente simples: envia os pedidos em uma conexão e devolve as respostas na mesma ordem
+    """
+    if caminho_socket:
+        leitor, escritor = await asyncio.open_unix_connection(caminho_socket)
+    else:
+        leitor, escritor = await asyncio.open_connection(host, porta)
+
+    respostas = []
+    try:
+        for pedido in pedidos:
+            escritor.write(json.dumps(pedido, ensure_ascii=False).encode('utf-8') + b'\n')
+        await escritor.drain()
+        for _ in pedidos:
+            respostas.append(json.loads(await leitor.readline()))
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
+    return respostas
+
+def servir(endereco, automatos):
+    """
+    endereco: porta TCP em localhost ou `unix:<caminho>`; automatos: lista de `nome=caminho`
+    """
+    registro = {}
+    for item in automatos:
+        nome, caminho = item.split('=', 1)
+        registro[nome] = carregar_automato(caminho)
+
+    async def executar():
+        if endereco.startswith('unix:'):
+            servidor, _, _ = await iniciar_servico(registro, caminho_socket=endereco[5:])
+        else:
+            servidor, _, _ = await iniciar_servico(registro, porta=int(endereco))
+        for sock in servidor.sockets:
+            print(f"Servindo em {sock.getsockname()} | autômatos: {', '.join(registro) or '-'}")
+        async with servidor:
+            await servidor.serve_forever()
+
+    try:
+        asyncio.run(executar())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    servir(sys.argv[1], sys.argv[2:])